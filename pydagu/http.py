@@ -1,26 +1,38 @@
 # Functions for calling Dagu's HTTP API
 import re
+from functools import cache
 
 import httpx
 from yaml import dump, Dumper, safe_load
 
 from .models import Dag, StartDagRun, DagRunId, DagResponseMessage, DagRunResult
+from .models.request import dump_start_dag_run
+from .models.response import DagRunDetails
 
 
 url_pattern = re.compile(r"^https?://[^\s/$.?#].[^\s]*$")
 
 
+@cache
+def _shared_client(url_root: str) -> httpx.Client:
+    """Connection-pooling client shared by all DaguHttpClients for a URL root"""
+    return httpx.Client(limits=httpx.Limits(max_keepalive_connections=32))
+
+
 class DaguHttpClient:
-    def __init__(self, dag_name: str, url_root: str) -> None:
+    def __init__(
+        self, dag_name: str, url_root: str, client: httpx.Client | None = None
+    ) -> None:
         self.dag_name = dag_name
         self.url_root = url_root.strip().rstrip("/")
         if not url_pattern.match(self.url_root):
             raise ValueError(f"Invalid URL root: {self.url_root}")
+        self.client = client or _shared_client(self.url_root)
 
     def get_dag_spec(self) -> Dag:
         """Fetch a DAG from the Dagu HTTP API by its ID."""
         url = f"{self.url_root}/dags/{self.dag_name}/spec"
-        response = httpx.get(url)
+        response = self.client.get(url)
         response.raise_for_status()
         dag_data = response.json()
         dag_yaml = dag_data["spec"]
@@ -38,10 +50,10 @@ class DaguHttpClient:
             "name": self.dag_name,
             "spec": dag_yaml,
         }
-        response = httpx.post(url, json=body_json)
+        response = self.client.post(url, json=body_json)
 
         if response.status_code in (400, 409):
-            return DagResponseMessage.model_validate(response.json())
+            return DagResponseMessage.from_trusted(response.json())
 
         response.raise_for_status()
         return None
@@ -56,10 +68,10 @@ class DaguHttpClient:
         body_json = {
             "spec": dag_yaml,
         }
-        response = httpx.put(url, json=body_json)
+        response = self.client.put(url, json=body_json)
 
         if response.status_code in (400, 409):
-            return DagResponseMessage.model_validate(response.json())
+            return DagResponseMessage.from_trusted(response.json())
 
         response.raise_for_status()
         return None
@@ -67,7 +79,7 @@ class DaguHttpClient:
     def delete_dag(self) -> None:
         """Delete a DAG from the Dagu HTTP API by its name."""
         url = f"{self.url_root}/dags/{self.dag_name}"
-        httpx.delete(url).raise_for_status()
+        self.client.delete(url).raise_for_status()
 
     def start_dag_run(
         self, start_request: StartDagRun
@@ -79,16 +91,20 @@ class DaguHttpClient:
         in which case it returns DagResponseMessage.
         """
         url = f"{self.url_root}/dags/{self.dag_name}/start"
-        response = httpx.post(url, json=start_request.model_dump())
+        response = self.client.post(
+            url,
+            content=dump_start_dag_run(start_request),
+            headers={"Content-Type": "application/json"},
+        )
         response.raise_for_status()
 
         status_code = response.status_code
         if status_code in (200, 409):
             dag_run_data = response.json()
             if status_code == 409:
-                return DagResponseMessage.model_validate(dag_run_data)
+                return DagResponseMessage.from_trusted(dag_run_data)
             else:
-                return DagRunId.model_validate(dag_run_data)
+                return DagRunId.from_trusted(dag_run_data)
 
         response.raise_for_status()
         raise httpx.HTTPError(f"Unexpected status code: {status_code}")
@@ -100,7 +116,7 @@ class DaguHttpClient:
         dag_run_id: The ID of the DAG run to fetch or "latest" for the most recent run.
         """
         url = f"{self.url_root}/dag-runs/{self.dag_name}/{dag_run_id}"
-        response = httpx.get(url)
+        response = self.client.get(url)
         response.raise_for_status()
-        dag_run_data = response.json()
-        return DagRunResult.model_validate(dag_run_data["dagRunDetails"])
+        # Validated rather than trusted: timestamps need parsing into datetimes
+        return DagRunDetails.model_validate_json(response.content).dagRunDetails
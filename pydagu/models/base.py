@@ -1,5 +1,7 @@
 """Base models and common types"""
 
+from typing import Any, Self, get_args
+
 from pydantic import BaseModel, Field
 
 
@@ -10,3 +12,40 @@ class Precondition(BaseModel):
         examples=["`date +%u`", "test -f /data/ready.flag", "$STATUS"]
     )
     expected: str = Field(examples=["re:[1-5]", "0", "success"])
+
+
+class DaguBase(BaseModel):
+    """Base for request and response models of the Dagu HTTP API"""
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Self:
+        """Build an instance from a Dagu API response, skipping validation
+
+        Only use this for data produced by Dagu itself: no type coercion is
+        applied. Nested DaguBase models, and lists of them, are constructed
+        recursively.
+        """
+        values = {}
+        for name, value in data.items():
+            field = cls.model_fields.get(name)
+            model = _nested_model(field.annotation) if field else None
+            if model is not None and isinstance(value, dict):
+                value = model.from_trusted(value)
+            elif model is not None and isinstance(value, list):
+                value = [
+                    model.from_trusted(item) if isinstance(item, dict) else item
+                    for item in value
+                ]
+            values[name] = value
+        return cls.model_construct(**values)
+
+
+def _nested_model(annotation: Any) -> type[DaguBase] | None:
+    """Find a DaguBase subclass within a field annotation, if any"""
+    if isinstance(annotation, type) and issubclass(annotation, DaguBase):
+        return annotation
+    for arg in get_args(annotation):
+        model = _nested_model(arg)
+        if model is not None:
+            return model
+    return None
@@ -2,13 +2,23 @@
 Pydantic models for requests to the Dagu HTTP API.
 """
 
-from pydantic import BaseModel
+from pydantic import TypeAdapter
 
+from .base import DaguBase
 
-class StartDagRun(BaseModel):
+
+class StartDagRun(DaguBase):
     """Model for starting a DAG run via the Dagu HTTP API."""
 
     params: str | None = None
     dagRunId: str | None = None
     dagName: str | None = None
     singleton: bool | None = None
+
+
+_START_DAG_RUN_ADAPTER = TypeAdapter(StartDagRun)
+
+
+def dump_start_dag_run(start_request: StartDagRun) -> bytes:
+    """Serialize a StartDagRun request body to JSON bytes, omitting unset fields."""
+    return _START_DAG_RUN_ADAPTER.dump_json(start_request, exclude_none=True)
@@ -2,27 +2,24 @@
 Pydantic models for Dagu HTTP API responses.
 """
 
-from datetime import datetime
+from .base import DaguBase
+from .types import OptionalDatetime
 
-from pydantic import BaseModel
 
-from .types import EmptyStrToNone
-
-
-class DagRunId(BaseModel):
+class DagRunId(DaguBase):
     """Model for DAG run ID response from the Dagu HTTP API."""
 
     dagRunId: str
 
 
-class DagResponseMessage(BaseModel):
+class DagResponseMessage(DaguBase):
     """Model for DAG start response from the Dagu HTTP API."""
 
     code: str
     message: str
 
 
-class DagSubRun(BaseModel):
+class DagSubRun(DaguBase):
     """
     Model for DAG run sub-run response from the Dagu HTTP API.
 
@@ -34,7 +31,7 @@ class DagSubRun(BaseModel):
     statusLabel: str
 
 
-class DagNodeStep(BaseModel):
+class DagNodeStep(DaguBase):
     """
     Model for DAG run node step response from the Dagu HTTP API.
 
@@ -46,7 +43,7 @@ class DagNodeStep(BaseModel):
     params: str | None = None
 
 
-class DagRunNode(BaseModel):
+class DagRunNode(DaguBase):
     """
     Model for DAG run node response from the Dagu HTTP API.
 
@@ -55,15 +52,15 @@ class DagRunNode(BaseModel):
     step: DagNodeStep
     status: int
     statusLabel: str
-    startedAt: datetime | EmptyStrToNone = None
-    finishedAt: datetime | EmptyStrToNone = None
+    startedAt: OptionalDatetime = None
+    finishedAt: OptionalDatetime = None
     retryCount: int | None = None
     stdout: str | None = None
     stderr: str | None = None
     subRuns: list[DagSubRun] | None = None
 
 
-class DagRunResult(BaseModel):
+class DagRunResult(DaguBase):
     """
     Model for DAG run result response from the Dagu HTTP API.
 
@@ -73,10 +70,19 @@ class DagRunResult(BaseModel):
     name: str
     status: int
     statusLabel: str
-    startedAt: datetime | EmptyStrToNone = None
-    finishedAt: datetime | EmptyStrToNone = None
+    startedAt: OptionalDatetime = None
+    finishedAt: OptionalDatetime = None
     params: str | None = None
     nodes: list[DagRunNode]
 
 
+class DagRunDetails(DaguBase):
+    """
+    Envelope for the DAG run status response from the Dagu HTTP API.
+
+    """
+
+    dagRunDetails: DagRunResult
+
+
 __all__ = ["DagRunId", "DagResponseMessage", "DagRunResult"]
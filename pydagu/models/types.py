@@ -1,6 +1,7 @@
-from typing import Annotated, TypeAlias
+from datetime import datetime
+from typing import Annotated, Literal, TypeAlias
 
-from pydantic import BeforeValidator
+from pydantic import BeforeValidator, Field
 
 
 def _empty_str_to_none(v: str | None) -> None:
@@ -13,4 +14,13 @@ def _empty_str_to_none(v: str | None) -> None:
     )  # Not str or None, Fall to next type. e.g. Decimal, or a non-empty str
 
 
-EmptyStrToNone: TypeAlias = Annotated[None, BeforeValidator(_empty_str_to_none)]
+EmptyStrToNone: TypeAlias = Annotated[
+    None,
+    BeforeValidator(_empty_str_to_none, json_schema_input_type=Literal[""] | None),
+]
+
+# Left-to-right union: datetime is tried first, so the Python validator above
+# only runs for empty or missing timestamps rather than for every value.
+OptionalDatetime: TypeAlias = Annotated[
+    datetime | EmptyStrToNone, Field(union_mode="left_to_right")
+]
@@ -2,10 +2,12 @@ import uuid
 import time
 import json
 import threading
+from collections import deque
 from collections.abc import Generator
 from typing import Any
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
+import httpx
 import pytest
 
 from pydagu.http import DaguHttpClient
@@ -13,10 +15,34 @@ from pydagu.builder import DagBuilder, StepBuilder
 from pydagu.models import StartDagRun, DagRunId, DagRunResult, Step
 
 
+def _json_response(payload: dict[str, Any]) -> bytes:
+    """Build a complete HTTP 200 response with a JSON body"""
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.0 200 OK\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
 class WebhookHandler(BaseHTTPRequestHandler):
     """Simple HTTP request handler for testing webhooks"""
 
-    received_requests: list[dict[str, Any]] = []
+    received_requests: deque[dict[str, Any]] = deque(maxlen=1024)
+
+    # Responses are constant, so they are encoded once rather than per request
+    _GET_RESPONSE_BYTES = _json_response(
+        {
+            "user_id": "12345",
+            "name": "Test User",
+            "email": "test@example.com",
+            "status": "active",
+        }
+    )
+    _RESPONSE_BYTES = _json_response(
+        {"status": "received", "message": "Webhook received successfully"}
+    )
 
     def do_GET(self):
         """Handle GET requests"""
@@ -24,46 +50,31 @@ class WebhookHandler(BaseHTTPRequestHandler):
         request_data = {
             "method": "GET",
             "path": self.path,
-            "headers": dict(self.headers),
+            # HTTPMessage supports case-insensitive lookups; no need to copy it
+            "headers": self.headers,
         }
         WebhookHandler.received_requests.append(request_data)
 
         # Send a successful response with JSON data
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        response = {
-            "user_id": "12345",
-            "name": "Test User",
-            "email": "test@example.com",
-            "status": "active",
-        }
-        self.wfile.write(json.dumps(response).encode("utf-8"))
+        self.wfile.write(WebhookHandler._GET_RESPONSE_BYTES)
 
     def do_POST(self):
         """Handle POST requests"""
         content_length = int(self.headers.get("Content-Length", 0))
-        body = (
-            self.rfile.read(content_length).decode("utf-8")
-            if content_length > 0
-            else ""
-        )
+        # Kept as raw bytes: json.loads parses bytes directly, no decode step
+        body = self.rfile.read(content_length) if content_length > 0 else b""
 
         # Store the received request
         request_data = {
             "method": "POST",
             "path": self.path,
-            "headers": dict(self.headers),
-            "body": body,
+            "headers": self.headers,
+            "body_bytes": body,
         }
         WebhookHandler.received_requests.append(request_data)
 
         # Send a successful response
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        response = {"status": "received", "message": "Webhook received successfully"}
-        self.wfile.write(json.dumps(response).encode("utf-8"))
+        self.wfile.write(WebhookHandler._RESPONSE_BYTES)
 
     def log_message(self, format, *args):
         """Suppress default logging to avoid cluttering test output"""
@@ -71,13 +82,15 @@ class WebhookHandler(BaseHTTPRequestHandler):
 
 
 @pytest.fixture
-def http_server() -> Generator[tuple[HTTPServer, int], None, None]:
+def http_server() -> Generator[tuple[ThreadingHTTPServer, int], None, None]:
     """Start a simple HTTP server for testing webhooks"""
     # Reset the received requests
-    WebhookHandler.received_requests = []
+    WebhookHandler.received_requests.clear()
 
-    # Create the server on an available port
-    server = HTTPServer(("localhost", 0), WebhookHandler)
+    # Create the server on an available port; each request gets its own
+    # thread so concurrent webhooks aren't serialized behind one another
+    server = ThreadingHTTPServer(("localhost", 0), WebhookHandler)
+    server.daemon_threads = True
     port = server.server_address[1]
 
     # Start server in a background thread
@@ -91,14 +104,63 @@ def http_server() -> Generator[tuple[HTTPServer, int], None, None]:
     server.server_close()
 
 
+@pytest.fixture(scope="session")
+def dagu_http_session() -> Generator[httpx.Client, None, None]:
+    """Keep-alive HTTP client shared by every test talking to Dagu"""
+    with httpx.Client() as session:
+        yield session
+
+
 @pytest.fixture
-def dagu_client() -> Generator[DaguHttpClient, None, None]:
+def dagu_client(
+    dagu_http_session: httpx.Client,
+) -> Generator[DaguHttpClient, None, None]:
     dag_name = uuid.uuid4().hex[:39]
-    client = DaguHttpClient(dag_name=dag_name, url_root="http://localhost:8080/api/v2/")
+    client = DaguHttpClient(
+        dag_name=dag_name,
+        url_root="http://localhost:8080/api/v2/",
+        client=dagu_http_session,
+    )
     yield client
     client.delete_dag()
 
 
+# Run states after which Dagu will not change a run's status again
+TERMINAL_STATUSES = {"succeeded", "failed", "aborted", "partially_succeeded"}
+
+
+def wait_for_status(
+    client: DaguHttpClient,
+    dag_run_id: str,
+    target: str = "succeeded",
+    timeout: float = 5.0,
+    interval: float = 0.02,
+) -> DagRunResult:
+    """Poll a DAG run until it reaches the target or a terminal status
+
+    Polls with exponential backoff (capped at 0.1s) and returns the last
+    result seen once the deadline passes, leaving the assertion to the caller.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        result = client.get_dag_run_status(dag_run_id)
+        if result.statusLabel == target or result.statusLabel in TERMINAL_STATUSES:
+            return result
+        if time.monotonic() >= deadline:
+            return result
+        time.sleep(interval)
+        interval = min(interval * 2, 0.1)
+
+
+def test_clients_share_connection_pool():
+    """Test that clients for the same Dagu server reuse one httpx.Client"""
+    first = DaguHttpClient(dag_name="first", url_root="http://localhost:8080/api/v2")
+    second = DaguHttpClient(dag_name="second", url_root="http://localhost:8080/api/v2/")
+    other = DaguHttpClient(dag_name="other", url_root="http://localhost:9090/api/v2")
+    assert first.client is second.client
+    assert first.client is not other.client
+
+
 def test_post_and_run_dag(dagu_client: DaguHttpClient):
     dag = (
         DagBuilder(dagu_client.dag_name)
@@ -130,8 +192,7 @@ def test_post_and_run_dag(dagu_client: DaguHttpClient):
     assert dag_run_result.statusLabel == "running"
 
     # Wait for DAG run to complete
-    time.sleep(0.5)
-    dag_run_result = dagu_client.get_dag_run_status(dag_run_id.dagRunId)
+    dag_run_result = wait_for_status(dagu_client, dag_run_id.dagRunId)
     assert dag_run_result.statusLabel == "succeeded"
 
 
@@ -181,13 +242,14 @@ def test_update_dag(dagu_client: DaguHttpClient):
     assert dag_run_id.dagRunId is not None
 
     # Wait for DAG run to complete
-    time.sleep(0.5)
-    dag_run_result = dagu_client.get_dag_run_status(dag_run_id.dagRunId)
+    dag_run_result = wait_for_status(dagu_client, dag_run_id.dagRunId)
     assert dag_run_result.statusLabel == "succeeded"
     assert len(dag_run_result.nodes) == 3
 
 
-def test_webhook_dag(dagu_client: DaguHttpClient, http_server: tuple[HTTPServer, int]):
+def test_webhook_dag(
+    dagu_client: DaguHttpClient, http_server: tuple[ThreadingHTTPServer, int]
+):
     """
     Test posting a DAG for executing a webhook. It required parameters for the url, headers, and payload.
 
@@ -236,11 +298,8 @@ def test_webhook_dag(dagu_client: DaguHttpClient, http_server: tuple[HTTPServer,
     assert isinstance(dag_run_id, DagRunId)
     assert dag_run_id.dagRunId is not None
 
-    # Wait for the DAG to complete
-    time.sleep(2)
-
-    # Check the DAG run status
-    dag_run_result = dagu_client.get_dag_run_status(dag_run_id.dagRunId)
+    # Wait for the DAG to complete and check the DAG run status
+    dag_run_result = wait_for_status(dagu_client, dag_run_id.dagRunId)
     assert isinstance(dag_run_result, DagRunResult)
     assert dag_run_result.dagRunId == dag_run_id.dagRunId
     assert (
@@ -256,7 +315,7 @@ def test_webhook_dag(dagu_client: DaguHttpClient, http_server: tuple[HTTPServer,
     assert received_request["headers"]["Authorization"] == "Bearer test-token"
 
     # Verify the payload
-    received_body = json.loads(received_request["body"])
+    received_body = json.loads(received_request["body_bytes"])
     assert received_body == webhook_payload
     assert received_body["event"] == "test_event"
     assert received_body["data"]["message"] == "Hello from Dagu!"
@@ -314,7 +373,7 @@ def test_http_executor_validation():
 
 
 def test_chained_http_requests_with_retries(
-    dagu_client: DaguHttpClient, http_server: tuple[HTTPServer, int]
+    dagu_client: DaguHttpClient, http_server: tuple[ThreadingHTTPServer, int]
 ):
     """
     Test a sophisticated workflow with chained HTTP requests:
@@ -408,11 +467,8 @@ def test_chained_http_requests_with_retries(
     assert isinstance(dag_run_id, DagRunId)
     assert dag_run_id.dagRunId is not None
 
-    # Wait for the DAG to complete (longer wait for chained requests)
-    time.sleep(3)
-
-    # Check the DAG run status
-    dag_run_result = dagu_client.get_dag_run_status(dag_run_id.dagRunId)
+    # Wait for the DAG to complete (longer timeout for chained requests)
+    dag_run_result = wait_for_status(dagu_client, dag_run_id.dagRunId, timeout=10.0)
     assert isinstance(dag_run_result, DagRunResult)
     assert dag_run_result.dagRunId == dag_run_id.dagRunId
     assert dag_run_result.statusLabel == "succeeded"
@@ -437,14 +493,14 @@ def test_chained_http_requests_with_retries(
     # Verify the POST body contains the data structure
     # Note: The actual USER_DATA substitution happens in Dagu's runtime,
     # so in the YAML it will still have the variable reference
-    post_body = json.loads(post_request["body"])
+    post_body = json.loads(post_request["body_bytes"])
     assert post_body["event"] == "user_fetched"
     assert "user_data" in post_body
     assert post_body["source"] == "dag-pipeline"
 
 
 def test_application_webhook_with_callback(
-    dagu_client: DaguHttpClient, http_server: tuple[HTTPServer, int]
+    dagu_client: DaguHttpClient, http_server: tuple[ThreadingHTTPServer, int]
 ):
     """
     Test the complete application webhook pattern:
@@ -576,11 +632,8 @@ def test_application_webhook_with_callback(
     dag_run_id = dagu_client.start_dag_run(start_request)
     assert isinstance(dag_run_id, DagRunId)
 
-    # Wait for completion
-    time.sleep(3)
-
-    # Check the DAG run status
-    dag_run_result = dagu_client.get_dag_run_status(dag_run_id.dagRunId)
+    # Wait for completion and check the DAG run status
+    dag_run_result = wait_for_status(dagu_client, dag_run_id.dagRunId, timeout=10.0)
     assert dag_run_result.statusLabel == "succeeded"
 
     # Verify both requests were received
@@ -592,7 +645,7 @@ def test_application_webhook_with_callback(
     assert external_request["path"] == "/external/slack/notify"
     assert "Authorization" in external_request["headers"]
 
-    external_body = json.loads(external_request["body"])
+    external_body = json.loads(external_request["body_bytes"])
     assert external_body["channel"] == "#notifications"
     assert "Order" in external_body["text"]
     assert external_body["metadata"]["event_type"] == "order.placed"
@@ -605,7 +658,7 @@ def test_application_webhook_with_callback(
         callback_request["headers"]["X-Webhook-Id"] == "wh_123456789"
     )  # Dagu substitutes params
 
-    callback_body = json.loads(callback_request["body"])
+    callback_body = json.loads(callback_request["body_bytes"])
     assert callback_body["status"] == "completed"
     assert callback_body["event_data"]["event_type"] == "order.placed"
     assert "external_response" in callback_body
@@ -622,7 +675,7 @@ def test_application_webhook_with_callback(
 
 
 def test_generic_parameterized_webhook(
-    dagu_client: DaguHttpClient, http_server: tuple[HTTPServer, int]
+    dagu_client: DaguHttpClient, http_server: tuple[ThreadingHTTPServer, int]
 ):
     """
     Test a generic reusable webhook DAG with parameters.
@@ -680,11 +733,8 @@ def test_generic_parameterized_webhook(
     assert isinstance(dag_run_id, DagRunId)
     assert dag_run_id.dagRunId is not None
 
-    # Wait for completion
-    time.sleep(2)
-
-    # Check the DAG run status
-    dag_run_result = dagu_client.get_dag_run_status(dag_run_id.dagRunId)
+    # Wait for completion and check the DAG run status
+    dag_run_result = wait_for_status(dagu_client, dag_run_id.dagRunId)
     assert isinstance(dag_run_result, DagRunResult)
 
     # Debug: Print status if failed
@@ -709,7 +759,7 @@ def test_generic_parameterized_webhook(
     assert received_request["headers"]["X-Generic-Webhook"] == "true"
 
     # Verify body
-    received_body = json.loads(received_request["body"])
+    received_body = json.loads(received_request["body_bytes"])
     assert received_body["source"] == "generic-webhook"
 
     # Note: This test reveals that Dagu's HTTP executor doesn't support
@@ -1,5 +1,7 @@
 """Tests for Pydantic models"""
 
+import json
+
 import pytest
 from pydantic import ValidationError
 
@@ -13,7 +15,11 @@ from pydagu.models import (
     HTTPExecutorConfig,
     ContainerConfig,
     SMTPConfig,
+    DagRunId,
+    StartDagRun,
 )
+from pydagu.models.request import dump_start_dag_run
+from pydagu.models.response import DagNodeStep, DagRunDetails, DagRunNode, DagSubRun
 
 
 # DAG Model Tests
@@ -375,3 +381,85 @@ def test_step_requires_command_or_script():
         ValidationError, match="must have at least one of: command or script"
     ):
         Step(name="empty-step")
+
+
+# Request Model Tests
+
+
+def test_dump_start_dag_run():
+    """Test serializing a start DAG run request to JSON bytes"""
+    body = dump_start_dag_run(StartDagRun(dagName="test-dag", singleton=True))
+    assert isinstance(body, bytes)
+    assert json.loads(body) == {"dagName": "test-dag", "singleton": True}
+
+
+# Response Model Tests
+
+
+def test_dag_run_id_from_trusted():
+    """Test building a response model from trusted Dagu data"""
+    run_id = DagRunId.from_trusted({"dagRunId": "abc123"})
+    assert isinstance(run_id, DagRunId)
+    assert run_id.dagRunId == "abc123"
+
+
+def test_from_trusted_constructs_nested_models():
+    """Test that nested models and lists of models are constructed"""
+    node = DagRunNode.from_trusted(
+        {
+            "step": {"name": "step1", "command": "echo 1"},
+            "status": 4,
+            "statusLabel": "succeeded",
+            "subRuns": [
+                {"dagRunId": "sub1", "name": "child", "status": 4, "statusLabel": "ok"}
+            ],
+        }
+    )
+    assert isinstance(node.step, DagNodeStep)
+    assert node.step.name == "step1"
+    assert isinstance(node.subRuns[0], DagSubRun)
+    assert node.subRuns[0].dagRunId == "sub1"
+
+
+def test_dag_run_details_from_json():
+    """Test parsing a DAG run status response straight from JSON bytes"""
+    payload = (
+        b'{"dagRunDetails": {"dagRunId": "abc123", "name": "test-dag", '
+        b'"status": 1, "statusLabel": "running", '
+        b'"startedAt": "2025-11-17T10:00:00Z", "finishedAt": "", '
+        b'"nodes": [{"step": {"name": "step1"}, "status": 1, '
+        b'"statusLabel": "running", "startedAt": "", "finishedAt": ""}]}}'
+    )
+    result = DagRunDetails.model_validate_json(payload).dagRunDetails
+    assert result.dagRunId == "abc123"
+    assert result.startedAt.year == 2025
+    assert result.finishedAt is None
+    assert result.nodes[0].step.name == "step1"
+    assert result.nodes[0].startedAt is None
+
+
+@pytest.mark.parametrize("value", ["", None])
+def test_dag_run_node_empty_timestamp(value):
+    """Test that empty or missing timestamps validate to None"""
+    node = DagRunNode.model_validate(
+        {
+            "step": {"name": "step1"},
+            "status": 0,
+            "statusLabel": "not started",
+            "startedAt": value,
+        }
+    )
+    assert node.startedAt is None
+
+
+def test_dag_run_node_invalid_timestamp():
+    """Test that a non-empty, non-datetime timestamp is rejected"""
+    with pytest.raises(ValidationError):
+        DagRunNode.model_validate(
+            {
+                "step": {"name": "step1"},
+                "status": 0,
+                "statusLabel": "not started",
+                "startedAt": "yesterday",
+            }
+        )
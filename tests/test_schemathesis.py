@@ -4,7 +4,10 @@ This module uses Schemathesis to generate random DAG configurations based on
 the Pydantic models, then validates them using the local dagu CLI.
 """
 
+import itertools
+import shutil
 import subprocess
+from functools import cache
 from pathlib import Path
 import pytest
 import yaml
@@ -13,30 +16,75 @@ from hypothesis import strategies as st
 
 from pydagu.models import Dag
 
+try:
+    from yaml import CDumper as Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import Dumper
+
 
 # Test configuration
 MAX_HYPOTHESIS_EXAMPLES = 10
 
 OUTPUT_DIR = Path(__file__).parent / "generated_dags"
 
+# Resolved once: an absolute path, together with close_fds=False and no
+# inherited stdin, lets subprocess spawn dagu via the cheaper posix_spawn()
+DAGU_EXECUTABLE = shutil.which("dagu") or "dagu"
+
+
+# Strategies that don't depend on arguments are built once at import
+# rather than on every draw
+
+# Restricted alphabet that avoids control characters and invalid unicode
+VALID_TEXT_ALPHABET = st.characters(
+    blacklist_categories=("Cc", "Cs"),  # Control and surrogate characters
+    blacklist_characters="\x00\x01\x02\x03\x04\x05\x06\x07\x08\x0b\x0c\x0e\x0f",
+)
+
+# dagu requires: alphanumeric characters, dashes, dots, and underscores only
+DAG_NAME = st.from_regex(r"[a-zA-Z0-9][a-zA-Z0-9._-]{0,49}", fullmatch=True)
+
+# Either use a predefined safe command or generate alphanumeric text
+COMMAND_TEXT = st.one_of(
+    # Predefined safe commands
+    st.sampled_from(
+        [
+            "echo hello",
+            "ls",
+            "pwd",
+            "./script.sh",
+            "python main.py",
+            "node index.js",
+            "bash run.sh",
+        ]
+    ),
+    # Or generate alphanumeric command-like strings with common separators
+    st.text(
+        alphabet=st.characters(
+            whitelist_categories=("L", "N"),  # Letters and numbers
+            whitelist_characters=" -./_",  # Common command separators
+        ),
+        min_size=2,
+        max_size=50,
+    ).filter(lambda s: s and s.strip() and not s.isspace()),
+)
+
 
 # Custom text strategy that avoids control characters and invalid unicode
 @st.composite
 def valid_text(draw, min_size=0, max_size=None):
     """Generate valid printable text (ASCII + common unicode, no control chars)"""
-    # Use a restricted alphabet that avoids problematic unicode
-    alphabet = st.characters(
-        blacklist_categories=("Cc", "Cs"),  # Control and surrogate characters
-        blacklist_characters="\x00\x01\x02\x03\x04\x05\x06\x07\x08\x0b\x0c\x0e\x0f",
+    return draw(
+        st.text(
+            alphabet=VALID_TEXT_ALPHABET, min_size=min_size, max_size=max_size or 20
+        )
     )
-    return draw(st.text(alphabet=alphabet, min_size=min_size, max_size=max_size or 20))
 
 
 @st.composite
 def dag_name_strategy(draw):
     """Generate a valid DAG name (alphanumeric, dashes, dots, underscores)"""
-    # dagu requires: alphanumeric characters, dashes, dots, and underscores only
-    return draw(st.from_regex(r"[a-zA-Z0-9][a-zA-Z0-9._-]{0,49}", fullmatch=True))
+    return draw(DAG_NAME)
 
 
 @st.composite
@@ -46,33 +94,7 @@ def command_text(draw):
     This avoids special YAML characters that could cause issues when used alone,
     and ensures the text is meaningful as a command.
     """
-    # Use a strategy that generates actual command-like strings
-    # Either use a predefined safe command or generate alphanumeric text
-    return draw(
-        st.one_of(
-            # Predefined safe commands
-            st.sampled_from(
-                [
-                    "echo hello",
-                    "ls",
-                    "pwd",
-                    "./script.sh",
-                    "python main.py",
-                    "node index.js",
-                    "bash run.sh",
-                ]
-            ),
-            # Or generate alphanumeric command-like strings with common separators
-            st.text(
-                alphabet=st.characters(
-                    whitelist_categories=("L", "N"),  # Letters and numbers
-                    whitelist_characters=" -./_",  # Common command separators
-                ),
-                min_size=2,
-                max_size=50,
-            ).filter(lambda s: s and s.strip() and not s.isspace()),
-        )
-    )
+    return draw(COMMAND_TEXT)
 
 
 @st.composite
@@ -111,89 +133,107 @@ def steps_with_unique_names(draw):
 
 
 # Hypothesis strategies for generating valid cron expressions
+MONTH_NAMES = (
+    "JAN",
+    "FEB",
+    "MAR",
+    "APR",
+    "MAY",
+    "JUN",
+    "JUL",
+    "AUG",
+    "SEP",
+    "OCT",
+    "NOV",
+    "DEC",
+)
+WEEKDAY_NAMES = ("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT")
+
+
 @st.composite
-def cron_field(draw, min_val, max_val, allow_names=None):
-    """Generate a valid cron field value
+def range_value(draw, min_val, max_val):
+    """Generate a cron range: start-end"""
+    start = draw(st.integers(min_value=min_val, max_value=max_val))
+    end = draw(st.integers(min_value=start, max_value=max_val))
+    return f"{start}-{end}"
+
+
+@st.composite
+def step_value(draw, min_val, max_val):
+    """Generate a cron step: */step or start-end/step"""
+    base = draw(st.sampled_from(["*", "range"]))
+    if base == "*":
+        step = draw(
+            st.integers(min_value=1, max_value=max(1, (max_val - min_val) // 2))
+        )
+        return f"*/{step}"
+    else:
+        # For ranges with steps, ensure step is reasonable
+        start = draw(st.integers(min_value=min_val, max_value=max_val))
+        end = draw(st.integers(min_value=start, max_value=max_val))
+        range_size = end - start
+        if range_size > 0:
+            step = draw(st.integers(min_value=1, max_value=max(1, range_size)))
+            return f"{start}-{end}/{step}"
+        else:
+            return f"{start}"
+
+
+def list_value(min_val, max_val):
+    """Generate a cron list: val1,val2,val3"""
+    return (
+        st.lists(
+            st.integers(min_value=min_val, max_value=max_val),
+            min_size=2,
+            max_size=5,
+            unique=True,
+        )
+        .map(sorted)
+        .map(lambda values: ",".join(map(str, values)))
+    )
+
+
+@st.composite
+def named_range(draw, names):
+    """Generate a named cron range, e.g. MON-FRI"""
+    indices = draw(
+        st.lists(
+            st.integers(min_value=0, max_value=len(names) - 1),
+            min_size=2,
+            max_size=2,
+            unique=True,
+        )
+    )
+    # Sort to ensure start <= end
+    start_idx, end_idx = sorted(indices)
+    return f"{names[start_idx]}-{names[end_idx]}"
+
+
+@cache
+def cron_field(min_val, max_val, allow_names=None):
+    """Build the strategy for a valid cron field value
+
+    The strategy is cached per field spec, so it is only built once.
 
     Args:
-        draw: Hypothesis draw function
         min_val: Minimum numeric value
         max_val: Maximum numeric value
-        allow_names: Optional list of named values (e.g., ['MON', 'TUE'])
+        allow_names: Optional tuple of named values (e.g., ('MON', 'TUE'))
     """
     choices = [
         st.just("*"),  # Any value
         st.integers(min_value=min_val, max_value=max_val).map(str),  # Single value
+        range_value(min_val, max_val),
+        step_value(min_val, max_val),
+        list_value(min_val, max_val),
     ]
 
-    # Range: start-end
-    @st.composite
-    def range_value(draw):
-        start = draw(st.integers(min_value=min_val, max_value=max_val))
-        end = draw(st.integers(min_value=start, max_value=max_val))
-        return f"{start}-{end}"
-
-    choices.append(range_value())
-
-    # Step: */step or start-end/step
-    @st.composite
-    def step_value(draw):
-        base = draw(st.sampled_from(["*", "range"]))
-        if base == "*":
-            step = draw(
-                st.integers(min_value=1, max_value=max(1, (max_val - min_val) // 2))
-            )
-            return f"*/{step}"
-        else:
-            # For ranges with steps, ensure step is reasonable
-            start = draw(st.integers(min_value=min_val, max_value=max_val))
-            end = draw(st.integers(min_value=start, max_value=max_val))
-            range_size = end - start
-            if range_size > 0:
-                step = draw(st.integers(min_value=1, max_value=max(1, range_size)))
-                return f"{start}-{end}/{step}"
-            else:
-                return f"{start}"
-
-    choices.append(step_value())
-
-    # List: val1,val2,val3
-    @st.composite
-    def list_value(draw):
-        values = draw(
-            st.lists(
-                st.integers(min_value=min_val, max_value=max_val),
-                min_size=2,
-                max_size=5,
-                unique=True,
-            )
-        )
-        return ",".join(map(str, sorted(values)))
-
-    choices.append(list_value())
-
     # Named values (for month/weekday)
     if allow_names:
         choices.append(st.sampled_from(allow_names))
+        choices.append(named_range(allow_names))
 
-        # Named range - ensure proper ordering by using indices
-        @st.composite
-        def named_range(draw):
-            indices = draw(
-                st.lists(
-                    st.integers(min_value=0, max_value=len(allow_names) - 1),
-                    min_size=2,
-                    max_size=2,
-                    unique=True,
-                )
-            )
-            # Sort to ensure start <= end
-            start_idx, end_idx = sorted(indices)
-            return f"{allow_names[start_idx]}-{allow_names[end_idx]}"
-
-        choices.append(named_range())
-
-    return draw(st.one_of(*choices))
+    return st.one_of(*choices)
 
 
 @st.composite
@@ -209,29 +249,8 @@ def cron_expression(draw, include_year=False):
     minute = draw(cron_field(0, 59))
     hour = draw(cron_field(0, 23))
     day = draw(cron_field(1, 31))
-    month = draw(
-        cron_field(
-            1,
-            12,
-            allow_names=[
-                "JAN",
-                "FEB",
-                "MAR",
-                "APR",
-                "MAY",
-                "JUN",
-                "JUL",
-                "AUG",
-                "SEP",
-                "OCT",
-                "NOV",
-                "DEC",
-            ],
-        )
-    )
-    weekday = draw(
-        cron_field(0, 6, allow_names=["SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"])
-    )
+    month = draw(cron_field(1, 12, allow_names=MONTH_NAMES))
+    weekday = draw(cron_field(0, 6, allow_names=WEEKDAY_NAMES))
 
     parts = [minute, hour, day, month, weekday]
 
@@ -253,7 +272,7 @@ def setup_output_dir():
 def yaml_file():
     """Fixture that provides a file path and cleans it up after the test"""
     files_to_cleanup = []
-    counter = {"value": 0}  # Mutable counter to track file indices
+    counter = itertools.count()  # Track file indices
 
     def _create_file(dag: Dag, suffix: str = "") -> Path:
         """Save a DAG to a YAML file for reference
@@ -265,15 +284,16 @@ def yaml_file():
         Returns:
             Path to the saved file
         """
-        index = counter["value"]
-        counter["value"] += 1
+        index = next(counter)
 
         filename = f"dag_{index:03d}{suffix}.yaml"
         filepath = OUTPUT_DIR / filename
 
         dag_dict = dag.model_dump(exclude_none=True)
         with open(filepath, "w") as f:
-            yaml.dump(dag_dict, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(
+                dag_dict, f, Dumper=Dumper, default_flow_style=False, sort_keys=False
+            )
 
         files_to_cleanup.append(filepath)
         return filepath
@@ -286,6 +306,12 @@ def yaml_file():
             filepath.unlink()
 
 
+# dagu validate results keyed by YAML content. dagu only validates one file
+# per invocation, so rather than batching, identical DAGs (which Hypothesis
+# replays while shrinking) skip the subprocess.
+_validation_results: dict[str, tuple[bool, str]] = {}
+
+
 def validate_dag_with_dagu(filepath: Path) -> tuple[bool, str]:
     """Validate a DAG using the local dagu CLI
 
@@ -295,22 +321,19 @@ def validate_dag_with_dagu(filepath: Path) -> tuple[bool, str]:
     Returns:
         Tuple of (is_valid, message)
     """
+    content = filepath.read_text()
+    if content in _validation_results:
+        return _validation_results[content]
+
     try:
         result = subprocess.run(
-            ["dagu", "validate", str(filepath)],
+            [DAGU_EXECUTABLE, "validate", str(filepath)],
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             timeout=10.0,
+            close_fds=False,
         )
-
-        # dagu validate returns 0 on success
-        if result.returncode == 0:
-            return True, "Valid"
-        else:
-            # Return the error message from stderr or stdout
-            error_msg = result.stderr.strip() or result.stdout.strip()
-            return False, error_msg
-
     except subprocess.TimeoutExpired:
         return False, "Validation timed out"
     except FileNotFoundError:
@@ -318,6 +341,15 @@ def validate_dag_with_dagu(filepath: Path) -> tuple[bool, str]:
     except Exception as e:
         return False, f"Unexpected error: {str(e)}"
 
+    # dagu validate returns 0 on success
+    if result.returncode == 0:
+        outcome = (True, "Valid")
+    else:
+        # Return the error message from stderr or stdout
+        outcome = (False, result.stderr.strip() or result.stdout.strip())
+    _validation_results[content] = outcome
+    return outcome
+
 
 @pytest.mark.slow
 @given(
@@ -365,10 +397,7 @@ def test_dag_generation(dag_name, steps_data, cron, yaml_file):
         failed_path = yaml_file(dag, suffix="_hypothesis_failed")
 
         # Print the DAG for debugging
-        dag_yaml = yaml.dump(
-            dag.model_dump(exclude_none=True), default_flow_style=False
-        )
-        print(f"\nFailed DAG content:\n{dag_yaml}")
+        print(f"\nFailed DAG content:\n{saved_path.read_text()}")
 
         pytest.fail(
             f"Hypothesis-generated DAG validation failed with dagu CLI\n"
@@ -4,6 +4,7 @@ This module contains tests that validate DAG configurations using the
 local dagu CLI tool.
 """
 
+import itertools
 import json
 import subprocess
 from pathlib import Path
@@ -19,6 +20,9 @@ from pydagu.models import Dag
 MAX_EXAMPLES = 5
 OUTPUT_DIR = Path(__file__).parent / "generated_dags"
 
+# Monotonic file index for the specific-configuration tests
+_specific_index = itertools.count()
+
 
 # Hypothesis strategies for generating valid cron expressions
 @st.composite
@@ -374,8 +378,8 @@ def test_specific_dag_configurations(dag_name, dag_config, yaml_file):
     """Test specific DAG configurations using dagu CLI"""
     dag = Dag(**dag_config)
 
-    # Use a stable index for specific tests
-    index = hash(dag_name) % 1000
+    # Use a unique index for specific tests
+    index = next(_specific_index)
 
     # Save using the fixture
     filepath = yaml_file(dag, index, suffix=f"_specific_{dag_name}")